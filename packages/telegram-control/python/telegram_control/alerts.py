@@ -1,9 +1,11 @@
 """Alert formatting utilities for trading notifications."""
 
+import functools
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class AlertLevel(Enum):
@@ -16,14 +18,18 @@ class AlertLevel(Enum):
     CRITICAL = "🚨"
 
 
-@dataclass
+# Plain dict probe; cheaper than the Enum .value descriptor on every build()
+_LEVEL_EMOJI = {level: level.value for level in AlertLevel}
+
+
+@dataclass(slots=True)
 class AlertBuilder:
     """Builder for trading alerts."""
     
     level: AlertLevel
     title: str
     fields: List[Tuple[str, str]] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: Optional[datetime] = None
     
     @classmethod
     def info(cls, title: str) -> "AlertBuilder":
@@ -50,46 +56,54 @@ class AlertBuilder:
         """Create a critical alert."""
         return cls(level=AlertLevel.CRITICAL, title=title)
     
-    def field(self, name: str, value: str) -> "AlertBuilder":
+    def add_field(self, name: str, value: str) -> "AlertBuilder":
         """Add a field to the alert."""
         self.fields.append((name, value))
         return self
     
     def price(self, name: str, value: float, currency: str = "USD") -> "AlertBuilder":
         """Add a price field with formatting."""
-        return self.field(name, format_price(value, currency))
+        return self.add_field(name, format_price(value, currency))
     
     def percentage(self, name: str, value: float) -> "AlertBuilder":
         """Add a percentage field."""
         emoji = "📈" if value >= 0 else "📉"
-        return self.field(name, f"{emoji} {value:.2f}%")
+        return self.add_field(name, f"{emoji} {value:.2f}%")
     
     def build(self) -> str:
         """Build the alert message."""
-        lines = [f"{self.level.value} **{self.title}**"]
+        buf = [_LEVEL_EMOJI[self.level], " **", self.title, "**"]
         
         for name, value in self.fields:
-            lines.append(f"• *{name}*: {escape_markdown(value)}")
+            buf.extend(("\n• *", name, "*: ", escape_markdown(value)))
         
-        return "\n".join(lines)
+        return "".join(buf)
     
     def __str__(self) -> str:
         """String representation."""
         return self.build()
+    
+    field = add_field  # back-compat alias
+
+
+_PRICE_FORMATS = {
+    "USD": lambda value: f"${value:.2f}",
+    "USDC": lambda value: f"${value:.2f}",
+    "USDT": lambda value: f"${value:.2f}",
+    "BTC": lambda value: f"₿{value:.8f}",
+    "ETH": lambda value: f"Ξ{value:.6f}",
+}
 
 
 def format_price(value: float, currency: str = "USD") -> str:
     """Format a price value."""
-    currency = currency.upper()
+    if not currency.isupper():
+        currency = currency.upper()
     
-    if currency in ("USD", "USDC", "USDT"):
-        return f"${value:.2f}"
-    elif currency == "BTC":
-        return f"₿{value:.8f}"
-    elif currency == "ETH":
-        return f"Ξ{value:.6f}"
-    else:
+    fmt = _PRICE_FORMATS.get(currency)
+    if fmt is None:
         return f"{value:.4f} {currency}"
+    return fmt(value)
 
 
 def format_percentage(value: float) -> str:
@@ -98,12 +112,17 @@ def format_percentage(value: float) -> str:
     return f"{sign}{value:.2f}%"
 
 
+_MD_SPECIAL = "_*[]()~`>#+-=|{}.!"
+_MD_TABLE = str.maketrans({ch: "\\" + ch for ch in _MD_SPECIAL})
+_MD_NEEDLE = re.compile(f"[{re.escape(_MD_SPECIAL)}]")
+
+
+@functools.lru_cache(maxsize=4096)
 def escape_markdown(text: str) -> str:
     """Escape markdown special characters."""
-    chars = ["_", "*", "[", "]", "(", ")", "~", "`", ">", "#", "+", "-", "=", "|", "{", "}", ".", "!"]
-    for char in chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+    if _MD_NEEDLE.search(text) is None:
+        return text
+    return text.translate(_MD_TABLE)
 
 
 # Pre-built alert templates
@@ -117,9 +136,9 @@ def trade_executed(
     """Alert for executed trade."""
     return (
         AlertBuilder.success("Trade Executed")
-        .field("Side", side)
-        .field("Symbol", symbol)
-        .field("Amount", str(amount))
+        .add_field("Side", side)
+        .add_field("Symbol", symbol)
+        .add_field("Amount", str(amount))
         .price("Price", price)
         .price("Total", total)
         .build()
@@ -147,8 +166,8 @@ def risk_alert(metric: str, value: float, threshold: float) -> str:
     """Risk threshold alert."""
     return (
         AlertBuilder.warning("Risk Threshold Reached")
-        .field("Metric", metric)
-        .field("Current Value", f"{value:.2f}")
-        .field("Threshold", f"{threshold:.2f}")
+        .add_field("Metric", metric)
+        .add_field("Current Value", f"{value:.2f}")
+        .add_field("Threshold", f"{threshold:.2f}")
         .build()
     )
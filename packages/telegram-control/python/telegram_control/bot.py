@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Pattern, Union
 
 from telegram import Update
 from telegram.ext import (
@@ -31,11 +31,32 @@ class Bot:
         self,
         token: str,
         access_control: Optional[AccessControl] = None,
+        concurrent_updates: Optional[int] = None,
     ):
+        """
+        Create a bot.
+        
+        Args:
+            token: Telegram bot token.
+            access_control: Access control policy (open access by default).
+            concurrent_updates: Process up to this many updates at once,
+                including the auth check. None keeps PTB's default of
+                processing updates serially.
+        """
+        if concurrent_updates is not None and concurrent_updates < 1:
+            raise ValueError(f"concurrent_updates must be >= 1, got {concurrent_updates}")
+        
         self.token = token
         self.access_control = access_control or AccessControl()
+        self._concurrent_updates = concurrent_updates
         self._command_handlers: Dict[str, HandlerFunc] = {}
-        self._callback_handlers: List[tuple] = []  # (pattern, handler)
+        # Every callback entry carries its registration index so the first
+        # registered match wins, whichever table it lives in.
+        self._callback_count = 0
+        # String patterns keyed on the text before the first ":" -> [(seq, prefix, handler)]
+        self._prefix_handlers: Dict[str, List[tuple]] = {}
+        # Prefixes without ":" and regex patterns -> [(seq, "prefix" | "regex", pattern, handler)]
+        self._pattern_handlers: List[tuple] = []
         self._default_handler: Optional[HandlerFunc] = None
         self._application: Optional[Application] = None
     
@@ -52,15 +73,30 @@ class Bot:
     def command(self, name: str):
         """Decorator for command handlers."""
         def decorator(func: HandlerFunc) -> HandlerFunc:
-            self._command_handlers[f"/{name}"] = func
-            self._command_handlers[name] = func
+            self._command_handlers["/" + name.lstrip("/")] = func
             return func
         return decorator
     
     def callback(self, pattern: Union[str, Pattern]):
-        """Decorator for callback query handlers."""
+        """
+        Decorator for callback query handlers.
+        
+        String patterns match by prefix, compiled patterns via ``match``.
+        When several patterns match, the first one registered wins.
+        """
         def decorator(func: HandlerFunc) -> HandlerFunc:
-            self._callback_handlers.append((pattern, func))
+            seq = self._callback_count
+            if isinstance(pattern, str):
+                if ":" in pattern:
+                    key = pattern.split(":", 1)[0]
+                    self._prefix_handlers.setdefault(key, []).append((seq, pattern, func))
+                else:
+                    self._pattern_handlers.append((seq, "prefix", pattern, func))
+            elif hasattr(pattern, "match"):
+                self._pattern_handlers.append((seq, "regex", pattern, func))
+            else:
+                raise TypeError(f"Unsupported callback pattern: {pattern!r}")
+            self._callback_count = seq + 1
             return func
         return decorator
     
@@ -83,37 +119,31 @@ class Bot:
             return
         
         text = update.message.text or ""
-        parts = text.split()
+        parts = text.split(None, 1)
         cmd = parts[0] if parts else ""
+        if cmd and not cmd.startswith("/"):
+            cmd = "/" + cmd
         
         # Find handler
-        handler = self._command_handlers.get(cmd)
-        if handler:
-            ctx = MessageContext(
-                message=update.message,
-                user=update.effective_user,
-                chat_id=update.effective_chat.id if update.effective_chat else 0,
-                text=text,
-                bot=self,
-            )
-            try:
-                await handler(ctx)
-            except Exception as e:
-                logger.exception("Command handler error")
-                await update.message.reply_text(f"❌ Error: {e}")
-        elif self._default_handler:
-            ctx = MessageContext(
-                message=update.message,
-                user=update.effective_user,
-                chat_id=update.effective_chat.id if update.effective_chat else 0,
-                text=text,
-                bot=self,
+        handler = self._command_handlers.get(cmd) or self._default_handler
+        if handler is None:
+            return
+        
+        effective_chat = update.effective_chat
+        ctx = MessageContext(
+            message=update.message,
+            user=update.effective_user,
+            chat_id=effective_chat.id if effective_chat else 0,
+            text=text,
+            bot=self,
+        )
+        try:
+            await handler(ctx)
+        except Exception as e:
+            logger.exception(
+                "Default handler error" if handler is self._default_handler else "Command handler error"
             )
-            try:
-                await self._default_handler(ctx)
-            except Exception as e:
-                logger.exception("Default handler error")
-                await update.message.reply_text(f"❌ Error: {e}")
+            await update.message.reply_text(f"❌ Error: {e}")
     
     async def _handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle callback queries."""
@@ -122,44 +152,45 @@ class Bot:
         
         query = update.callback_query
         data = query.data or ""
+        ctx = CallbackContext(
+            query=query,
+            user=update.effective_user,
+            chat_id=update.effective_chat.id if update.effective_chat else 0,
+            data=data,
+            bot=self,
+        )
         
-        # Find matching handler
-        for pattern, handler in self._callback_handlers:
-            import re
-            if isinstance(pattern, str):
-                if data.startswith(pattern):
-                    ctx = CallbackContext(
-                        query=query,
-                        user=update.effective_user,
-                        chat_id=update.effective_chat.id if update.effective_chat else 0,
-                        data=data,
-                        bot=self,
-                    )
-                    try:
-                        await handler(ctx)
-                    except Exception as e:
-                        logger.exception("Callback handler error")
-                        await query.answer(f"Error: {e}")
-                    return
-            elif isinstance(pattern, Pattern):
-                if pattern.match(data):
-                    ctx = CallbackContext(
-                        query=query,
-                        user=update.effective_user,
-                        chat_id=update.effective_chat.id if update.effective_chat else 0,
-                        data=data,
-                        bot=self,
-                    )
-                    try:
-                        await handler(ctx)
-                    except Exception as e:
-                        logger.exception("Callback handler error")
-                        await query.answer(f"Error: {e}")
-                    return
+        # Find the earliest-registered match across the prefix bucket and the rest
+        handler = None
+        best = self._callback_count
+        for seq, prefix, func in self._prefix_handlers.get(data.split(":", 1)[0], ()):
+            if data.startswith(prefix):
+                handler, best = func, seq
+                break
+        for seq, kind, pattern, func in self._pattern_handlers:
+            if seq > best:
+                break
+            if data.startswith(pattern) if kind == "prefix" else pattern.match(data):
+                handler = func
+                break
+        
+        if handler is None:
+            return
+        
+        try:
+            await handler(ctx)
+        except Exception as e:
+            logger.exception("Callback handler error")
+            await query.answer(f"Error: {e}")
     
     def build(self) -> Application:
         """Build the Application instance."""
-        app = ApplicationBuilder().token(self.token).build()
+        app = (
+            ApplicationBuilder()
+            .token(self.token)
+            .concurrent_updates(self._concurrent_updates or False)
+            .build()
+        )
         
         # Add command handler
         app.add_handler(
@@ -167,7 +198,7 @@ class Bot:
         )
         
         # Add callback handler
-        if self._callback_handlers:
+        if self._prefix_handlers or self._pattern_handlers:
             app.add_handler(CallbackQueryHandler(self._handle_callback))
         
         self._application = app
@@ -195,3 +226,20 @@ class Bot:
     async def send_alert(self, chat_id: int, text: str, **kwargs):
         """Send an alert (formatted message)."""
         await self.send_message(chat_id, text, parse_mode="Markdown", **kwargs)
+    
+    async def send_many(self, chat_ids: Iterable[int], text: str, **kwargs):
+        """Send a message to several chats concurrently."""
+        if not self._application:
+            return
+        bot = self._application.bot
+        results = await asyncio.gather(
+            *(bot.send_message(chat_id=chat_id, text=text, **kwargs) for chat_id in chat_ids),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to deliver message: {result}")
+    
+    async def send_alert_many(self, chat_ids: Iterable[int], text: str, **kwargs):
+        """Send an alert (formatted message) to several chats concurrently."""
+        await self.send_many(chat_ids, text, parse_mode="Markdown", **kwargs)
@@ -2,12 +2,25 @@
 
 import functools
 import re
+import sys
 from typing import Any, Callable, Dict, List, Optional, get_type_hints
 
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on", "y"})
+
+# Argument type -> string coercer; unknown types are passed through as-is
+_COERCERS: Dict[Any, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    bool: lambda value: value.lower() in _BOOL_TRUE,
+    str: str,
+}
+
 
 class Command:
     """Represents a bot command."""
     
+    __slots__ = ("name", "description", "handler", "args", "coercers")
+    
     def __init__(
         self,
         name: str,
@@ -15,10 +28,13 @@ class Command:
         handler: Callable,
         args: Optional[List[tuple]] = None,
     ):
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
         self.handler = handler
         self.args = args or []
+        self.coercers = [
+            (arg_name, _COERCERS.get(arg_type, str)) for arg_name, arg_type in self.args
+        ]
     
     def __call__(self, *args, **kwargs):
         return self.handler(*args, **kwargs)
@@ -81,30 +97,20 @@ class CommandRegistry:
         args = parts[1:]
         parsed_args = []
         
-        for i, (arg_name, arg_type) in enumerate(cmd.args):
-            if i >= len(args):
-                break
-            
+        for (arg_name, coerce), value in zip(cmd.coercers, args):
             try:
-                if arg_type == int:
-                    parsed_args.append(int(args[i]))
-                elif arg_type == float:
-                    parsed_args.append(float(args[i]))
-                elif arg_type == bool:
-                    parsed_args.append(args[i].lower() in ("true", "1", "yes"))
-                else:
-                    parsed_args.append(args[i])
+                parsed_args.append(coerce(value))
             except ValueError:
-                raise ValueError(f"Invalid value for {arg_name}: {args[i]}")
+                raise ValueError(f"Invalid value for {arg_name}: {value}")
         
         return cmd, parsed_args
     
     def help_text(self) -> str:
         """Generate help text for all commands."""
-        lines = ["Available commands:"]
+        buf = ["Available commands:"]
         
         for cmd in self._commands.values():
             args_str = " ".join([f"<{name}>" for name, _ in cmd.args])
-            lines.append(f"  /{cmd.name} {args_str} - {cmd.description}")
+            buf.extend(("\n  /", cmd.name, " ", args_str, " - ", cmd.description))
         
-        return "\n".join(lines)
+        return "".join(buf)
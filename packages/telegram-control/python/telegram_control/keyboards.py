@@ -1,5 +1,6 @@
 """Keyboard builders for Telegram bots."""
 
+import functools
 from typing import List
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, KeyboardButton, ReplyKeyboardMarkup
@@ -33,9 +34,8 @@ class InlineKeyboardBuilder:
     
     def build(self) -> InlineKeyboardMarkup:
         """Build the keyboard."""
-        if self._current_row:
-            self._rows.append(self._current_row)
-        return InlineKeyboardMarkup(self._rows)
+        rows = self._rows + [self._current_row] if self._current_row else self._rows
+        return InlineKeyboardMarkup(rows)
 
 
 class ReplyKeyboardBuilder:
@@ -71,15 +71,15 @@ class ReplyKeyboardBuilder:
     
     def build(self) -> ReplyKeyboardMarkup:
         """Build the keyboard."""
-        if self._current_row:
-            self._rows.append(self._current_row)
+        rows = self._rows + [self._current_row] if self._current_row else self._rows
         return ReplyKeyboardMarkup(
-            self._rows,
+            rows,
             resize_keyboard=self._resize,
             one_time_keyboard=self._one_time,
         )
 
 
+@functools.lru_cache(maxsize=128)
 def confirm_keyboard(action: str) -> InlineKeyboardMarkup:
     """Confirmation keyboard (Yes/No)."""
     return (
@@ -105,6 +105,7 @@ def pagination_keyboard(current: int, total: int, prefix: str) -> InlineKeyboard
     return builder.build()
 
 
+@functools.lru_cache(maxsize=256)
 def trading_actions_keyboard(symbol: str) -> InlineKeyboardMarkup:
     """Trading action keyboard."""
     return (
@@ -118,6 +119,7 @@ def trading_actions_keyboard(symbol: str) -> InlineKeyboardMarkup:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def main_menu_keyboard() -> ReplyKeyboardMarkup:
     """Main menu keyboard."""
     return (
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from telegram.ext import CallbackContext as ExtCallbackContext
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     """Context for message-based commands."""
     
@@ -42,7 +42,7 @@ class MessageContext:
         return await self.reply(text, parse_mode="HTML", **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackContext:
     """Context for callback queries (inline keyboards)."""
     